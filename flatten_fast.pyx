@@ -0,0 +1,94 @@
+# cython: language_level=3
+"""
+Compiled version of JSONToCSVConverter.flatten_dict.
+
+Build it in place with `python setup.py build_ext --inplace`. When the
+extension is not built, json_to_csv_converter falls back to the pure Python
+implementation, which produces the same output.
+"""
+import sys
+
+import orjson
+
+# Flattened keys by (prefix, key), interned so each column name is shared by
+# every record; see _KEY_CACHE in json_to_csv_converter.py
+cdef dict _key_cache = {}
+cdef frozenset _SCALAR_TYPES = frozenset((str, int, float, bool))
+cdef Py_ssize_t _KEY_CACHE_LIMIT = 100000
+
+
+cdef str _join_key(str prefix, object key):
+    cdef tuple cache_key = (prefix, key)
+    cdef object joined = _key_cache.get(cache_key)
+    if joined is None:
+        if len(_key_cache) >= _KEY_CACHE_LIMIT:
+            _key_cache.clear()
+        joined = sys.intern(f"{prefix}{key}")
+        _key_cache[cache_key] = joined
+    return <str>joined
+
+
+cpdef str join_list(list value):
+    """
+    Join a list of scalars with ', ', or serialize it as a JSON string if any
+    item is not a scalar.
+    """
+    cdef list parts
+    cdef object item
+    if not value:
+        return ''
+    if type(value[0]) is str:
+        try:
+            return ', '.join(value)
+        except TypeError:
+            pass
+
+    parts = []
+    for item in value:
+        if type(item) not in _SCALAR_TYPES:
+            return orjson.dumps(value).decode()
+        parts.append(item if type(item) is str else str(item))
+    return ', '.join(parts)
+
+
+cpdef dict flatten(dict data, str strategy='dot_notation', str separator='.'):
+    """
+    Flatten a nested dictionary using dot notation.
+    """
+    cdef dict result = {}
+    cdef list stack = [('', iter(data.items()), False)]
+    cdef bint dot_notation = strategy == 'dot_notation'
+    cdef bint separate_columns = strategy == 'separate_columns'
+    cdef bint in_array
+    cdef str prefix, new_key
+    cdef object pairs, key, value
+    dumps = orjson.dumps
+
+    while stack:
+        prefix, pairs, in_array = stack[-1]
+        for key, value in pairs:
+            new_key = _join_key(prefix, key)
+
+            if type(value) is dict:
+                # Descend into nested dictionaries
+                stack.append((_join_key(new_key, separator), iter((<dict>value).items()), False))
+                break
+            elif in_array:
+                # Non-dict array element of a 'separate_columns' list
+                result[new_key] = value
+            elif type(value) is list:
+                if dot_notation:
+                    # Join simple lists as a string, keep complex ones as JSON
+                    result[new_key] = join_list(<list>value)
+                elif separate_columns:
+                    # Create separate columns for each array element
+                    stack.append((_join_key(new_key, '_'), enumerate(value), True))
+                    break
+                else:
+                    result[new_key] = dumps(value).decode()
+            else:
+                result[new_key] = value
+        else:
+            stack.pop()
+
+    return result
@@ -1,8 +1,339 @@
 import json
 import csv
+import io
+import mmap
+import os
+import sys
+import tempfile
+import orjson
 import pandas as pd
 from typing import Any, Dict, List, Union
 from pathlib import Path
+from functools import lru_cache, partial
+
+try:
+    # Optional compiled flattener, see flatten_fast.pyx and setup.py
+    from flatten_fast import flatten as flatten_fast, join_list as join_list_fast
+except ImportError:
+    flatten_fast = join_list_fast = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# Flattened keys by (prefix, key). Each distinct column name is built and
+# interned once and then shared by every record, instead of being rebuilt
+# as a new string per record. Cleared when it reaches _KEY_CACHE_LIMIT,
+# since that many distinct keys means keys hold data rather than schema.
+_KEY_CACHE = {}
+_KEY_CACHE_LIMIT = 100_000
+
+# Types that dot_notation joins into a string when a list holds only them.
+# Parsed JSON contains exact dict, list and scalar types, never subclasses,
+# so hot paths compare types by identity instead of calling isinstance.
+_SCALAR_TYPES = frozenset((str, int, float, bool))
+_NUMERIC_TYPES = frozenset((int, float, bool))
+
+# Buffer size for CSV output, large enough that wide, long outputs are
+# written with few write() calls
+CSV_BUFFER_SIZE = 1 << 20
+
+# Schema-specialized flattening (see _SchemaFlattener) is only used for at
+# least this many records; compiling the extractor costs as much as
+# flattening dozens of records generically, and grows with the sample's width
+SCHEMA_MIN_RECORDS = 1000
+
+# A schema extractor is dropped once at least SCHEMA_MIN_MISMATCHES records,
+# and more than SCHEMA_MAX_MISMATCH_RATIO of all records, failed to match it
+SCHEMA_MIN_MISMATCHES = 32
+SCHEMA_MAX_MISMATCH_RATIO = 0.1
+
+def _load_json(json_file: str) -> Any:
+    """
+    Parse a JSON file, reusing the parsed data while the file is unchanged.
+    
+    Several conversions of the same file (as in demo_conversion) then parse
+    it only once. The returned data is shared between calls, so callers
+    must not modify it.
+    """
+    stat = os.stat(json_file)
+    return _parse_json_file(os.path.abspath(json_file), stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=4)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a JSON file directly from a read-only memory map, without first
+    copying its contents into a bytes object. mtime_ns and size are only
+    part of the cache key.
+    """
+    if size == 0:
+        # Empty files cannot be mapped; let orjson report the error
+        return orjson.loads(b'')
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+            return orjson.loads(buf)
+
+def _open_csv(csv_file: str) -> io.TextIOWrapper:
+    """
+    Open a CSV file for writing as UTF-8 text on top of a CSV_BUFFER_SIZE
+    binary buffer.
+    """
+    return io.TextIOWrapper(open(csv_file, 'wb', buffering=CSV_BUFFER_SIZE), encoding='utf-8', newline='')
+
+def _join_key(prefix: str, key: Any) -> str:
+    """
+    Return the interned string prefix + key, building it only once.
+    """
+    cache_key = (prefix, key)
+    joined = _KEY_CACHE.get(cache_key)
+    if joined is None:
+        if len(_KEY_CACHE) >= _KEY_CACHE_LIMIT:
+            _KEY_CACHE.clear()
+        joined = _KEY_CACHE[cache_key] = sys.intern(f"{prefix}{key}")
+    return joined
+
+def _list_handler(strategy: str):
+    """
+    Return the function that turns a list into a single cell value under
+    the given strategy, or None for 'separate_columns', which expands
+    lists into one column per element.
+    """
+    if strategy == 'separate_columns':
+        return None
+    if strategy == 'dot_notation':
+        return _join_list
+    return _list_to_json
+
+def _flatten(data: Dict[str, Any], strategy: str, parent_key: str = '', separator: str = '.') -> Dict[str, Any]:
+    """
+    Flatten a nested dictionary using dot notation.
+    
+    Nested values are walked with an explicit stack instead of recursion.
+    Each stack entry holds a key prefix, an iterator over the remaining
+    (key, value) pairs and whether those pairs are array elements; the
+    parent entry is resumed once a nested dictionary is exhausted, so
+    keys come out in depth-first order.
+    
+    This backs JSONToCSVConverter.flatten_dict.
+    """
+    # Resolve the array handling once per call rather than once per key
+    list_to_str = _list_handler(strategy)
+    
+    result = {}
+    key_cache = _KEY_CACHE
+    stack = [(f"{parent_key}{separator}" if parent_key else '', iter(data.items()), False)]
+    
+    while stack:
+        prefix, pairs, in_array = stack[-1]
+        for key, value in pairs:
+            new_key = key_cache.get((prefix, key))
+            if new_key is None:
+                new_key = _join_key(prefix, key)
+            
+            value_type = type(value)
+            if value_type is dict:
+                # Descend into nested dictionaries
+                stack.append((_join_key(new_key, separator), iter(value.items()), False))
+                break
+            elif in_array:
+                # Non-dict array element of a 'separate_columns' list
+                result[new_key] = value
+            elif value_type is list:
+                # Handle arrays based on strategy
+                if list_to_str is not None:
+                    result[new_key] = list_to_str(value)
+                else:
+                    # Create separate columns for each array element
+                    stack.append((_join_key(new_key, '_'), enumerate(value), True))
+                    break
+            else:
+                result[new_key] = value
+        else:
+            stack.pop()
+    
+    return result
+
+def _list_to_json(value: List[Any]) -> str:
+    """
+    Serialize a list as a JSON string.
+    """
+    return orjson.dumps(value).decode()
+
+def _join_list(value: List[Any]) -> str:
+    """
+    Join a list of scalars with ', ', or serialize it as a JSON string if any
+    item is not a scalar. The list is traversed only once.
+    """
+    if not value:
+        return ''
+    if type(value[0]) is str:
+        # All-string lists (labels, logins) join directly, with no str() calls
+        try:
+            return ', '.join(value)
+        except TypeError:
+            pass
+    elif len(value) > 16 and _NUMERIC_TYPES.issuperset(map(type, value)):
+        # Long numeric lists: the list's repr already is the ', '-joined
+        # str() of every item, built in a single C-level call
+        return repr(value)[1:-1]
+    
+    parts = []
+    for item in value:
+        if type(item) not in _SCALAR_TYPES:
+            # Complex list - keep as JSON string
+            return _list_to_json(value)
+        parts.append(item if type(item) is str else str(item))
+    return ', '.join(parts)
+
+def _arrow_column(values: List[Any]):
+    """
+    Build an Arrow array for one CSV column, falling back to strings for
+    columns that mix types, hold ints outside the int64 range, or hold
+    lists Arrow cannot write as CSV. Float columns are also written as
+    strings, since Arrow's float formatting differs from str() (5.0 as 5,
+    1e-07 as 1e-7).
+    """
+    try:
+        column = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        column = None
+    if column is None or pa.types.is_nested(column.type) or pa.types.is_floating(column.type):
+        column = pa.array([None if value is None else str(value) for value in values], type=pa.string())
+    return column
+
+def _polars_column(name: str, values: List[Any]):
+    """
+    Build a polars Series for one CSV column, falling back to strings for
+    columns whose values do not share a single type, instead of letting
+    polars coerce them (True, 3, False would otherwise become 1, 3, 0).
+    """
+    try:
+        return pl.Series(name, values, strict=True)
+    except (TypeError, ValueError, OverflowError, pl.exceptions.PolarsError):
+        return pl.Series(name, [None if value is None else str(value) for value in values], dtype=pl.Utf8)
+
+def _flatten_record(record: Any, strategy: str) -> Dict[str, Any]:
+    """
+    Flatten one top-level record, using the compiled flattener when available.
+    """
+    if type(record) is not dict:
+        # Handle non-dict items in array
+        return {'value': record}
+    if flatten_fast is not None:
+        return flatten_fast(record, strategy)
+    return _flatten(record, strategy)
+
+class _SchemaMismatch(Exception):
+    """
+    Raised by a generated schema extractor when a record does not have the
+    shape of the sample record it was generated from.
+    """
+
+class _SchemaFlattener:
+    """
+    Flattener specialized to the shape of one sample record.
+    
+    The nested-dict layout of the sample is compiled into a Python function
+    that reads each leaf by its fixed path and builds the flattened dict in
+    one expression, with no per-key type dispatch. Dict key sets and leaf
+    types are checked against the sample, and records that do not match
+    are flattened with the generic flattener instead.
+    
+    A mismatching record is walked twice, so once more than
+    SCHEMA_MAX_MISMATCH_RATIO of the records seen so far have mismatched
+    (after at least SCHEMA_MIN_MISMATCHES), the extractor is dropped and
+    every remaining record goes straight to the generic flattener.
+    """
+    
+    def __init__(self, sample: Dict[str, Any], strategy: str):
+        self.sample = sample
+        self.strategy = strategy
+        self._extract = self._compile(sample, strategy)
+        self._calls = 0
+        self._mismatches = 0
+    
+    def __call__(self, record: Any) -> Dict[str, Any]:
+        if self._extract is not None and type(record) is dict:
+            self._calls += 1
+            try:
+                return self._extract(record)
+            except _SchemaMismatch:
+                self._mismatches += 1
+                if (self._mismatches >= SCHEMA_MIN_MISMATCHES
+                        and self._mismatches > self._calls * SCHEMA_MAX_MISMATCH_RATIO):
+                    self._extract = None
+        return _flatten_record(record, self.strategy)
+    
+    @staticmethod
+    def _compile(sample: Dict[str, Any], strategy: str):
+        """
+        Generate the extractor for the sample's shape, or return None if the
+        shape cannot be specialized ('separate_columns' with lists, whose
+        column count depends on each record).
+        """
+        list_to_str = _list_handler(strategy)
+        if list_to_str is _join_list and join_list_fast is not None:
+            list_to_str = join_list_fast
+        namespace = {
+            '_SchemaMismatch': _SchemaMismatch,
+            '_list_to_str': list_to_str,
+            '_scalar_types': _SCALAR_TYPES | {type(None)},
+        }
+        # Generated local names are numbered by the line that assigns them
+        checks = []
+        scalars = []
+        entries = []
+        
+        # Walk the sample in the same depth-first order as _flatten, so the
+        # generated dict has the same key order
+        stack = [('', 'r', iter(sample.items()))]
+        namespace['_keys0'] = frozenset(sample)
+        checks.append("if r.keys() != _keys0: raise _SchemaMismatch")
+        while stack:
+            prefix, var, pairs = stack[-1]
+            for key, value in pairs:
+                new_key = f"{prefix}{key}"
+                access = f"{var}[{key!r}]"
+                
+                n = len(checks)
+                if type(value) is dict:
+                    namespace[f'_keys{n}'] = frozenset(value)
+                    checks.append(f"d{n} = {access}")
+                    checks.append(f"if type(d{n}) is not dict or d{n}.keys() != _keys{n}: raise _SchemaMismatch")
+                    stack.append((f"{new_key}.", f"d{n}", iter(value.items())))
+                    break
+                elif type(value) is list:
+                    if list_to_str is None:
+                        return None
+                    checks.append(f"l{n} = {access}")
+                    checks.append(f"if type(l{n}) is not list: raise _SchemaMismatch")
+                    entries.append(f"{new_key!r}: _list_to_str(l{n})")
+                else:
+                    scalars.append(f"v{n}")
+                    checks.append(f"v{n} = {access}")
+                    entries.append(f"{new_key!r}: v{n}")
+            else:
+                stack.pop()
+        
+        if scalars:
+            checks.append(f"if not _scalar_types.issuperset(map(type, ({', '.join(scalars)},))): raise _SchemaMismatch")
+        
+        body = ''.join(f"    {line}\n" for line in checks)
+        source = f"def extract(r):\n{body}    return {{{', '.join(entries)}}}\n"
+        exec(source, namespace)
+        return namespace['extract']
 
 class JSONToCSVConverter:
     def __init__(self, flatten_strategy='dot_notation'):
@@ -22,43 +353,23 @@ class JSONToCSVConverter:
         """
         Flatten a nested dictionary using dot notation.
         """
-        items = []
-        for key, value in data.items():
-            new_key = f"{parent_key}{separator}{key}" if parent_key else key
-            
-            if isinstance(value, dict):
-                # Recursively flatten nested dictionaries
-                items.extend(self.flatten_dict(value, new_key, separator).items())
-            elif isinstance(value, list):
-                # Handle arrays based on strategy
-                if self.flatten_strategy == 'dot_notation':
-                    # Convert list to JSON string or create indexed columns
-                    if all(isinstance(item, (str, int, float, bool)) for item in value):
-                        # Simple list - join as string
-                        items.append((new_key, ', '.join(map(str, value))))
-                    else:
-                        # Complex list - keep as JSON string
-                        items.append((new_key, json.dumps(value)))
-                elif self.flatten_strategy == 'separate_columns':
-                    # Create separate columns for each array element
-                    for i, item in enumerate(value):
-                        if isinstance(item, dict):
-                            items.extend(self.flatten_dict(item, f"{new_key}_{i}", separator).items())
-                        else:
-                            items.append((f"{new_key}_{i}", item))
-                else:
-                    items.append((new_key, json.dumps(value)))
-            else:
-                items.append((new_key, value))
+        return _flatten(data, self.flatten_strategy, parent_key, separator)
+    
+    def compile_schema(self, sample_record: Dict[str, Any]):
+        """
+        Return a flattener specialized to the shape of sample_record.
         
-        return dict(items)
+        The returned callable flattens records exactly like flatten_dict,
+        but records with the sample's shape skip the generic traversal;
+        records of any other shape fall back to it.
+        """
+        return _SchemaFlattener(sample_record, self.flatten_strategy)
     
     def convert_with_custom_flattening(self, json_file: str, csv_file: str):
         """
         Convert JSON to CSV using custom flattening logic.
         """
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(json_file)
         
         # Handle both single objects and arrays of objects
         if isinstance(data, dict):
@@ -66,66 +377,164 @@ class JSONToCSVConverter:
         elif not isinstance(data, list):
             raise ValueError("JSON must contain an object or array of objects")
         
-        # Flatten each record
-        flattened_data = []
-        for record in data:
-            if isinstance(record, dict):
-                flattened_record = self.flatten_dict(record)
-                flattened_data.append(flattened_record)
-            else:
-                # Handle non-dict items in array
-                flattened_data.append({'value': record})
-        
-        if not flattened_data:
-            raise ValueError("No data to convert")
-        
-        # Get all possible fieldnames
-        fieldnames = set()
-        for record in flattened_data:
-            fieldnames.update(record.keys())
-        fieldnames = sorted(list(fieldnames))
-        
-        # Write to CSV
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(flattened_data)
+        # Flatten each record, collecting fieldnames and spooling the
+        # flattened record to a temporary NDJSON file in the same pass, so
+        # no list of flattened records is kept in memory
+        fieldnames = {}
+        count = 0
+        with tempfile.TemporaryFile() as spool:
+            for record in self._flatten_records(data):
+                for key in record:
+                    fieldnames[key] = None
+                spool.write(orjson.dumps(record))
+                spool.write(b'\n')
+                count += 1
+            
+            if not count:
+                raise ValueError("No data to convert")
+            
+            # Columns keep the order in which their keys were first seen
+            fieldnames = list(fieldnames)
+            
+            # Write to CSV, reading the flattened records back from the spool
+            spool.seek(0)
+            self._write_csv(csv_file, fieldnames, map(orjson.loads, spool))
         
-        print(f"Converted {len(flattened_data)} records to {csv_file}")
+        print(f"Converted {count} records to {csv_file}")
         print(f"Columns: {', '.join(fieldnames)}")
     
+    def _flatten_records(self, data: List[Any]):
+        """
+        Yield the flattened form of each record.
+        """
+        # Specialize flattening to the shape of the first object record, but
+        # only without the compiled flattener (which is faster than the
+        # generated extractor) and for inputs large enough to repay compiling
+        sample = None
+        if flatten_fast is None and len(data) >= SCHEMA_MIN_RECORDS:
+            sample = next((record for record in data if type(record) is dict), None)
+        if sample is not None:
+            flatten_record = self.compile_schema(sample)
+        else:
+            flatten_record = partial(_flatten_record, strategy=self.flatten_strategy)
+        
+        yield from map(flatten_record, data)
+    
     def convert_with_pandas(self, json_file: str, csv_file: str):
         """
         Convert JSON to CSV using pandas json_normalize for automatic flattening.
         """
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(json_file)
         
         # Use pandas json_normalize to flatten
-        if isinstance(data, dict):
-            df = pd.json_normalize(data)
-        elif isinstance(data, list):
-            df = pd.json_normalize(data)
+        if isinstance(data, (dict, list)):
+            df = pd.json_normalize(data, sep='.')
         else:
             raise ValueError("JSON must contain an object or array of objects")
         
-        # Handle remaining nested data by converting to strings
-        for column in df.columns:
-            df[column] = df[column].apply(
-                lambda x: json.dumps(x) if isinstance(x, (dict, list)) else x
-            )
+        # Handle remaining nested data (lists, and dicts inside lists) by
+        # converting to strings. Only object columns can hold them, and only
+        # columns that actually contain one are rewritten.
+        for column in df.columns[df.dtypes == object]:
+            values = df[column]
+            if values.map(type).isin([dict, list]).any():
+                df[column] = values.map(
+                    lambda x: orjson.dumps(x).decode() if isinstance(x, (dict, list)) else x
+                )
         
-        df.to_csv(csv_file, index=False)
+        with _open_csv(csv_file) as f:
+            df.to_csv(f, index=False, lineterminator='\n')
         print(f"Converted {len(df)} records to {csv_file}")
         print(f"Columns: {', '.join(df.columns)}")
     
+    def convert_with_polars(self, json_file: str, csv_file: str):
+        """
+        Convert JSON to CSV with the same columns as convert_with_pandas, but
+        build the table and write the CSV with polars.
+        
+        Records are flattened with the 'json_string' strategy, which, like
+        json_normalize, joins nested object keys with dots and keeps lists
+        as JSON strings. Every column is then scalar, so polars can build
+        it without the mixed-type list errors of pl.json_normalize.
+        
+        Unlike pandas, polars writes booleans as true/false, and it formats
+        floats with its own rules, which can differ from pandas. Columns
+        that mix scalar types (e.g. True, 3, False) are written as the
+        str() of each value instead of being coerced to a common type.
+        """
+        if pl is None:
+            raise ImportError("convert_with_polars requires the polars package")
+        
+        data = _load_json(json_file)
+        
+        if isinstance(data, dict):
+            data = [data]
+        elif not isinstance(data, list):
+            raise ValueError("JSON must contain an object or array of objects")
+        
+        rows = [_flatten_record(record, 'json_string') for record in data]
+        
+        # Get all fieldnames, in the order they were first seen
+        fieldnames = {}
+        for record in rows:
+            for key in record:
+                fieldnames[key] = None
+        
+        df = pl.DataFrame([
+            _polars_column(name, [record.get(name) for record in rows])
+            for name in fieldnames
+        ])
+        df.write_csv(csv_file)
+        print(f"Converted {len(df)} records to {csv_file}")
+        print(f"Columns: {', '.join(df.columns)}")
+    
+    def convert_with_arrow(self, json_file: str, csv_file: str):
+        """
+        Convert JSON to CSV using custom flattening, then write the CSV with
+        Arrow's C++ writer instead of the csv module.
+        
+        Values match the csv module's except for booleans, which Arrow
+        writes as true/false. The formatting also differs: Arrow quotes
+        every string value, including floats (written as strings to keep
+        str() formatting), and when the CSV has a single column, a null
+        value becomes a blank line where the csv module writes "".
+        """
+        if pa is None:
+            raise ImportError("convert_with_arrow requires the pyarrow package")
+        
+        data = _load_json(json_file)
+        
+        if isinstance(data, dict):
+            data = [data]
+        elif not isinstance(data, list):
+            raise ValueError("JSON must contain an object or array of objects")
+        
+        flattened_data = list(self._flatten_records(data))
+        if not flattened_data:
+            raise ValueError("No data to convert")
+        
+        # Get all fieldnames, in the order they were first seen
+        fieldnames = {}
+        for record in flattened_data:
+            for key in record:
+                fieldnames[key] = None
+        fieldnames = list(fieldnames)
+        
+        table = pa.table({
+            name: _arrow_column([record.get(name) for record in flattened_data])
+            for name in fieldnames
+        })
+        pa_csv.write_csv(table, csv_file)
+        
+        print(f"Converted {table.num_rows} records to {csv_file}")
+        print(f"Columns: {', '.join(fieldnames)}")
+    
     def convert_with_array_explosion(self, json_file: str, csv_file: str, array_field: str = None):
         """
         Convert JSON to CSV with array explosion (create multiple rows for array elements).
         Useful when you want each array item to become a separate row.
         """
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(json_file)
         
         if isinstance(data, dict):
             data = [data]
@@ -134,37 +543,114 @@ class JSONToCSVConverter:
         
         for record in data:
             if array_field and array_field in record and isinstance(record[array_field], list):
+                # The rest of the record is the same for every array element,
+                # so it is flattened only once
+                base = {key: value for key, value in record.items() if key != array_field}
+                base_flat = self.flatten_dict(base)
+                
                 # Create a row for each array element
                 for item in record[array_field]:
-                    new_record = record.copy()
-                    del new_record[array_field]
-                    
                     if isinstance(item, dict):
                         # Merge the array item's fields into the record
-                        new_record.update(item)
+                        item_flat = self.flatten_dict(item)
                     else:
                         # Simple value - use the array field name
-                        new_record[array_field] = item
+                        item_flat = self.flatten_dict({array_field: item})
                     
-                    exploded_data.append(self.flatten_dict(new_record))
+                    # Flattened item fields override record fields with the
+                    # same flattened key; other nested record fields are kept
+                    exploded_data.append({**base_flat, **item_flat})
             else:
                 exploded_data.append(self.flatten_dict(record))
         
-        # Get all fieldnames
-        fieldnames = set()
+        # Get all fieldnames, in the order they were first seen
+        fieldnames = {}
         for record in exploded_data:
-            fieldnames.update(record.keys())
-        fieldnames = sorted(list(fieldnames))
+            for key in record:
+                fieldnames[key] = None
+        fieldnames = list(fieldnames)
         
         # Write to CSV
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(exploded_data)
+        self._write_csv(csv_file, fieldnames, exploded_data)
         
         print(f"Converted {len(exploded_data)} records to {csv_file}")
         print(f"Columns: {', '.join(fieldnames)}")
 
+    def convert_streaming(self, json_file: str, csv_file: str):
+        """
+        Convert a JSON array to CSV without loading the whole file into memory.
+        Records are parsed one at a time with ijson, so the file must contain
+        a top-level array of objects.
+        """
+        if ijson is None:
+            raise ImportError("convert_streaming requires the ijson package")
+        
+        def read_records():
+            with open(json_file, 'rb') as f:
+                # use_float keeps numbers as floats instead of Decimal
+                yield from ijson.items(f, 'item', use_float=True)
+        
+        self._stream_to_csv(read_records, csv_file)
+    
+    def convert_ndjson(self, json_file: str, csv_file: str):
+        """
+        Convert newline-delimited JSON (one object per line) to CSV,
+        parsing one line at a time.
+        """
+        def read_records():
+            with open(json_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line)
+        
+        self._stream_to_csv(read_records, csv_file)
+    
+    def _stream_to_csv(self, read_records, csv_file: str):
+        """
+        Write records to CSV in two streaming passes: the first collects the
+        fieldnames, the second writes one row per record. read_records is
+        called once per pass and must return a fresh iterator of records.
+        """
+        def flattened_records():
+            return map(partial(_flatten_record, strategy=self.flatten_strategy), read_records())
+        
+        # First pass: get all possible fieldnames
+        fieldnames = {}
+        count = 0
+        for record in flattened_records():
+            for key in record:
+                fieldnames[key] = None
+            count += 1
+        
+        if not count:
+            raise ValueError("No data to convert")
+        
+        # Columns keep the order in which their keys were first seen
+        fieldnames = list(fieldnames)
+        
+        # Second pass: write each record as soon as it is flattened
+        self._write_csv(csv_file, fieldnames, flattened_records())
+        
+        print(f"Converted {count} records to {csv_file}")
+        print(f"Columns: {', '.join(fieldnames)}")
+    
+    def _write_csv(self, csv_file: str, fieldnames: List[str], records):
+        """
+        Write flattened records to CSV with csv.writer. Each value is placed
+        by its column index, avoiding DictWriter's per-column lookups.
+        """
+        index = {key: i for i, key in enumerate(fieldnames)}
+        empty_row = [''] * len(fieldnames)
+        
+        with _open_csv(csv_file) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for record in records:
+                row = empty_row.copy()
+                for key, value in record.items():
+                    row[index[key]] = value
+                writer.writerow(row)
+
 def demo_conversion():
     """
     Demonstrate different conversion strategies with sample data.
@@ -218,6 +704,16 @@ def demo_conversion():
     converter = JSONToCSVConverter()
     converter.convert_with_pandas('sample_data.json', 'output_pandas.csv')
     
+    # Try polars
+    if pl is not None:
+        print(f"\n--- Using polars ---")
+        converter.convert_with_polars('sample_data.json', 'output_polars.csv')
+    
+    # Try the Arrow CSV writer
+    if pa is not None:
+        print(f"\n--- Using pyarrow CSV writer ---")
+        converter.convert_with_arrow('sample_data.json', 'output_arrow.csv')
+    
     # Try array explosion on contacts
     print(f"\n--- Using array explosion on 'contacts' ---")
     converter.convert_with_array_explosion('sample_data.json', 'output_exploded.csv', 'contacts')
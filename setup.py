@@ -0,0 +1,9 @@
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Builds the optional compiled flattener used by json_to_csv_converter.py:
+#   python setup.py build_ext --inplace
+setup(
+    name='flatten_fast',
+    ext_modules=cythonize('flatten_fast.pyx'),
+)